@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "CREATE SEQUENCE api_orders_order_no_seq "
+                "MINVALUE 0 MAXVALUE 9999999999 START 1000000000",
+                # Continue after the highest existing numeric order number.
+                "SELECT setval('api_orders_order_no_seq', COALESCE("
+                "(SELECT MAX(order_no::bigint) FROM api_orders "
+                "WHERE order_no ~ '^[0-9]+$'), 999999999))",
+            ],
+            reverse_sql="DROP SEQUENCE api_orders_order_no_seq",
+        ),
+    ]
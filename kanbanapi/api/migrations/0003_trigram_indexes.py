@@ -0,0 +1,37 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("api", "0002_orders_order_no_seq"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("art_no"),
+                    name="gin_trgm_ops",
+                ),
+                name="api_article_art_no_trgm",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="tags",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("tag_id"),
+                    name="gin_trgm_ops",
+                ),
+                name="api_tags_tag_id_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="orders",
+            name="timestamp",
+            field=models.DateTimeField(
+                db_default=models.Func(
+                    function="clock_timestamp", output_field=models.DateTimeField()
+                )
+            ),
+        ),
+    ]
@@ -6,7 +6,10 @@ This module defines the database models following Clean Code principles:
 - Proper documentation
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Article(models.Model):
@@ -22,6 +25,21 @@ class Article(models.Model):
     )
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("art_no", "description", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="api_article_search_gin"),
+            # Serves art_no__icontains (UPPER(art_no) LIKE UPPER('%...%'))
+            GinIndex(
+                OpClass(Upper("art_no"), name="gin_trgm_ops"),
+                name="api_article_art_no_trgm",
+            ),
+        ]
 
 
 class Tags(models.Model):
@@ -37,6 +55,15 @@ class Tags(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Serves tag_id__icontains (UPPER(tag_id) LIKE UPPER('%...%'))
+            GinIndex(
+                OpClass(Upper("tag_id"), name="gin_trgm_ops"),
+                name="api_tags_tag_id_trgm",
+            ),
+        ]
+
 
 class Orders(models.Model):
     """Orders model for orders"""
@@ -50,15 +77,17 @@ class Orders(models.Model):
         help_text="Der Status der Bestellung (0=offen, 1=abgeschlossen).",
         default=0,
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # clock_timestamp() advances within a transaction, so every row of a
+    # multi-row INSERT gets its own timestamp.
+    timestamp = models.DateTimeField(
+        db_default=models.Func(
+            function="clock_timestamp", output_field=models.DateTimeField()
+        )
+    )
 
     def save(self, *args, **kwargs):
         if not self.order_no:
             from api.views import generate_unique_order_no
 
             self.order_no = generate_unique_order_no()
-        if not self.timestamp:
-            from django.utils import timezone
-
-            self.timestamp = timezone.now()
         super().save(*args, **kwargs)
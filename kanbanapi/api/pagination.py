@@ -0,0 +1,42 @@
+"""Pagination classes for KanbanAPI.
+
+List endpoints are paginated with cursors on an indexed column and keep
+the flat response format:
+{"success": true, "data": [...], "next": "...", "previous": "..."}
+"""
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KanbanCursorPagination(CursorPagination):
+    """Cursor pagination wrapping each page in the success envelope."""
+
+    page_size = 1000
+    page_size_query_param = "page_size"
+    max_page_size = 5000
+
+    def get_paginated_data(self, data):
+        return {
+            "success": True,
+            "data": data,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+class ArticlePagination(KanbanCursorPagination):
+    # art_no is not unique; DRF resolves rows sharing a cursor position with
+    # an offset, which stays cheap as long as duplicates are rare.
+    ordering = "art_no"
+
+
+class TagPagination(KanbanCursorPagination):
+    ordering = "tag_id"
+
+
+class OrderPagination(KanbanCursorPagination):
+    ordering = "order_no"
@@ -0,0 +1,33 @@
+"""Renderers for KanbanAPI.
+
+This module contains the JSON renderer used for all API responses.
+"""
+
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses to JSON using orjson.
+
+    Types orjson does not handle natively (e.g. Decimal or lazy
+    translation strings) fall back to DRF's JSONEncoder, so the output
+    stays compatible with the default JSONRenderer.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if renderer_context and renderer_context.get("indent"):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_fallback_encoder.default, option=option)
@@ -0,0 +1,170 @@
+"""Tests for the KanbanAPI endpoints.
+
+The tests run against PostgreSQL (trigram indexes, generated search
+vectors and the order number sequence are Postgres-only) and cover the
+response formats clients depend on: the paginated envelope, ETag / 304
+handling and the HTTP status of tag create failures.
+"""
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from api.models import Article, Orders, Tags
+
+
+class KanbanAPITestCase(APITestCase):
+    """Base class clearing the response cache between tests."""
+
+    def setUp(self):
+        cache.clear()
+
+
+class ArticleListTests(KanbanAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for art_no in ("A1", "A2", "A3"):
+            Article.objects.create(art_no=art_no, description=f"Artikel {art_no}")
+
+    def test_pages_follow_cursor_links(self):
+        response = self.client.get("/api/articles/", {"page_size": 2})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertTrue(body["success"])
+        self.assertEqual([a["art_no"] for a in body["data"]], ["A1", "A2"])
+        self.assertIsNotNone(body["next"])
+
+        body = self.client.get(body["next"]).json()
+        self.assertEqual([a["art_no"] for a in body["data"]], ["A3"])
+        self.assertIsNone(body["next"])
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get("/api/articles/")["ETag"]
+        response = self.client.get("/api/articles/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_matching_etag_returns_304_on_cache_miss(self):
+        etag = self.client.get("/api/articles/")["ETag"]
+        cache.clear()
+        response = self.client.get("/api/articles/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_supplier_update_changes_etag(self):
+        etag = self.client.get("/api/articles/")["ETag"]
+        response = self.client.post(
+            "/api/articles/",
+            {"action": "update", "data": {"art_no": "A1", "art_supplier": "SW"}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/articles/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"][0]["art_supplier"], "SW")
+
+    def test_browsable_api_is_served_for_html(self):
+        response = self.client.get("/api/articles/", HTTP_ACCEPT="text/html")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
+
+
+class TagCreateTests(KanbanAPITestCase):
+    def setUp(self):
+        super().setUp()
+        Article.objects.create(art_no="A1", description="Artikel A1")
+
+    def create_tag(self, **data):
+        return self.client.post(
+            "/api/tags/", {"action": "create", "data": data}, format="json"
+        )
+
+    def test_create(self):
+        response = self.create_tag(tag_id="T1", art_no="A1")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Tags.objects.get(tag_id="T1").art_no.art_no, "A1")
+
+    def test_duplicate_tag_returns_409(self):
+        self.create_tag(tag_id="T1", art_no="A1")
+        response = self.create_tag(tag_id="T1", art_no="A1")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["error"], "Tag already exists")
+
+    def test_unknown_article_returns_404(self):
+        response = self.create_tag(tag_id="T1", art_no="NOPE")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["error"], "Article not found")
+        self.assertFalse(Tags.objects.exists())
+
+    def test_invalid_status_returns_400(self):
+        response = self.create_tag(tag_id="T1", art_no="A1", status=None)
+        self.assertEqual(response.status_code, 400)
+
+    def test_duplicate_article_numbers_resolve_to_lowest_pk(self):
+        first = Article.objects.get(art_no="A1")
+        Article.objects.create(art_no="A1", description="Duplikat")
+        self.create_tag(tag_id="T1", art_no="A1")
+        self.assertEqual(Tags.objects.get(tag_id="T1").art_no_id, first.pk)
+
+
+class TagListTests(KanbanAPITestCase):
+    def setUp(self):
+        super().setUp()
+        article = Article.objects.create(art_no="A1", description="Artikel A1")
+        for tag_id in ("T1", "T2", "T3"):
+            Tags.objects.create(tag_id=tag_id, art_no=article)
+
+    def test_pages_follow_cursor_links(self):
+        body = self.client.get("/api/tags/", {"page_size": 2}).json()
+        self.assertEqual([t["tag_id"] for t in body["data"]], ["T1", "T2"])
+        body = self.client.get(body["next"]).json()
+        self.assertEqual([t["tag_id"] for t in body["data"]], ["T3"])
+        self.assertIsNone(body["next"])
+
+    def test_etag_changes_with_tag_status(self):
+        etag = self.client.get("/api/tags/")["ETag"]
+        response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.post(
+            "/api/tags/",
+            {"action": "set_status", "data": {"tag_id": "T1;T3", "status": 1}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        statuses = {t["tag_id"]: t["status"] for t in response.json()["data"]}
+        self.assertEqual(statuses, {"T1": 1, "T2": 0, "T3": 1})
+
+    def test_html_and_json_etags_differ(self):
+        json_etag = self.client.get("/api/tags/")["ETag"]
+        html_etag = self.client.get("/api/tags/", HTTP_ACCEPT="text/html")["ETag"]
+        self.assertNotEqual(json_etag, html_etag)
+
+    def test_delete(self):
+        response = self.client.delete(
+            "/api/tags/", {"tag_ids": "T1; T2"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(Tags.objects.values_list("tag_id", flat=True)), ["T3"])
+
+
+class OrderTests(KanbanAPITestCase):
+    def test_create_and_list(self):
+        response = self.client.post(
+            "/api/orders/",
+            {"action": "create", "data": {"art_no": ["A1", "A2"]}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        created = response.json()["data"]
+        self.assertEqual(len(created), 2)
+        self.assertEqual(len({order["order_no"] for order in created}), 2)
+        self.assertEqual(Orders.objects.count(), 2)
+
+        body = self.client.get("/api/orders/").json()
+        self.assertTrue(body["success"])
+        self.assertEqual(
+            [order["order_no"] for order in body["data"]],
+            sorted(order["order_no"] for order in created),
+        )
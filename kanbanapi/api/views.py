@@ -8,12 +8,140 @@ from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParam
 from rest_framework import status, serializers
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q, Subquery
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from psycopg2 import errorcodes
 
 from api.models import Article, Tags, Orders
+from api.pagination import ArticlePagination, OrderPagination, TagPagination
+from api.renderers import ORJSONRenderer
+
+import hashlib
+import os
+import threading
+import time
+
+VALID_SUPPLIERS = frozenset({"OKB", "RKB", "SW"})
+VALID_STATUSES = frozenset({0, 1})
+TAG_ACTIONS = frozenset({"create", "update", "set_status", "generate", "search"})
+ORDER_ACTIONS = frozenset({"create", "update"})
+
+ARTICLES_CACHE_PREFIX = "articles:v2:"
+ARTICLES_CACHE_TTL = 30
+
+TAG_ID_BYTES = 12
+TAG_ID_ENTROPY_BUFFER_SIZE = 4096
+
+_tag_id_entropy = threading.local()
+
+PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        name="cursor",
+        description="Cursor from the previous response's next/previous link",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="page_size",
+        description="Number of results per page (max 5000)",
+        required=False,
+        type=int,
+    ),
+]
+
+
+def _paginated_list_response(name, data_serializer):
+    """Build the schema of a paginated list response."""
+    return inline_serializer(
+        name=name,
+        fields={
+            "success": serializers.BooleanField(default=True),
+            "data": data_serializer,
+            "next": serializers.URLField(allow_null=True),
+            "previous": serializers.URLField(allow_null=True),
+        },
+    )
+
+
+def _is_choice(value, choices):
+    """Return whether a request value is one of the allowed choices.
+
+    JSON bodies may contain unhashable values (lists, objects), which are
+    never valid choices.
+    """
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
+
+def _articles_version():
+    """Return the current version counter of the article data.
+
+    The counter is bumped when articles change through the API, so cache
+    keys that embed it are invalidated at once in every process sharing
+    the cache backend. With the default per-process LocMemCache
+    that is only the writing worker; elsewhere, staleness is bounded by
+    ARTICLES_CACHE_TTL.
 
-import secrets
-import string
+    A missing counter (evicted or culled) restarts from the current time,
+    so it never falls back to a value older cache keys were built with.
+    """
+    return cache.get_or_set(f"{ARTICLES_CACHE_PREFIX}version", time.time_ns, None)
+
+
+def _articles_cache_key(request):
+    """Build the cache key for an article list request."""
+    # Pagination links are absolute, so the host is part of the key.
+    return (
+        f"{ARTICLES_CACHE_PREFIX}{_articles_version()}:{request.get_host()}:"
+        f"{request.query_params.urlencode()}"
+    )
+
+
+def invalidate_articles_cache():
+    """Invalidate cached article list responses.
+
+    Only reaches processes that share the cache backend (see
+    _articles_version()).
+    """
+    try:
+        cache.incr(f"{ARTICLES_CACHE_PREFIX}version")
+    except ValueError:
+        cache.set(f"{ARTICLES_CACHE_PREFIX}version", time.time_ns(), None)
+
+
+def _make_etag(data):
+    """Build a quoted strong ETag from the given bytes."""
+    return quote_etag(hashlib.md5(data, usedforsecurity=False).hexdigest())
+
+
+def _not_modified_response(request, etag):
+    """Return a 304 response if the client already holds ``etag``, else None."""
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" in etags or etag in etags:
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept",))
+        return response
+    return None
+
+
+def _json_etag_response(request, etag, payload):
+    """Serve a rendered JSON payload with its ETag, or 304 if the client has it."""
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response = HttpResponse(payload, content_type="application/json")
+    response["ETag"] = etag
+    patch_vary_headers(response, ("Accept",))
+    return response
 
 
 class ArticlesView(APIView):
@@ -22,6 +150,8 @@ class ArticlesView(APIView):
     POST: create or update article (action in body)
     """
 
+    pagination_class = ArticlePagination
+
     @extend_schema(
         summary="Liste aller Artikel",
         parameters=[
@@ -44,34 +174,49 @@ class ArticlesView(APIView):
                 type=str,
                 enum=["OKB", "RKB", "SW"],
             ),
+            *PAGINATION_PARAMETERS,
         ],
         responses={
-            200: inline_serializer(
-                name="ArticleListResponse",
-                fields={
-                    "success": serializers.BooleanField(default=True),
-                    "data": inline_serializer(
-                        name="ArticleData",
-                        fields={
-                            "art_no": serializers.CharField(),
-                            "art_supplier": serializers.ChoiceField(
-                                choices=["OKB", "RKB", "SW"]
-                            ),
-                            "description": serializers.CharField(),
-                        },
-                        many=True,
-                    ),
-                },
+            200: _paginated_list_response(
+                "ArticleListResponse",
+                inline_serializer(
+                    name="ArticleData",
+                    fields={
+                        "art_no": serializers.CharField(),
+                        "art_supplier": serializers.ChoiceField(
+                            choices=["OKB", "RKB", "SW"]
+                        ),
+                        "description": serializers.CharField(),
+                    },
+                    many=True,
+                ),
             )
         },
         tags=["Articles"],
     )
     def get(self, request):
-        qs = Article.objects.all().only("art_no", "art_supplier", "description")
+        # Only the JSON rendering is cached and sent directly; other
+        # renderers (the browsable API) take DRF's normal response path.
+        json_requested = isinstance(request.accepted_renderer, ORJSONRenderer)
+        if json_requested:
+            cache_key = _articles_cache_key(request)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                etag, payload = cached
+                return _json_etag_response(request, etag, payload)
+
+        qs = Article.objects.values("art_no", "art_supplier", "description")
 
         search = request.query_params.get("search")
         if search:
-            qs = qs.filter(Q(art_no__icontains=search))
+            qs = qs.filter(
+                Q(art_no__icontains=search)
+                | Q(
+                    search_vector=SearchQuery(
+                        search, config="simple", search_type="websearch"
+                    )
+                )
+            )
 
         art_no = request.query_params.get("art_no")
         if art_no:
@@ -81,15 +226,18 @@ class ArticlesView(APIView):
         if art_supplier:
             qs = qs.filter(art_supplier=art_supplier)
 
-        data = [
-            {
-                "art_no": a.art_no,
-                "art_supplier": a.art_supplier,
-                "description": a.description,
-            }
-            for a in qs
-        ]
-        return Response({"success": True, "data": data}, status=status.HTTP_200_OK)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        if not json_requested:
+            response = paginator.get_paginated_response(page)
+            patch_vary_headers(response, ("Accept",))
+            return response
+
+        payload = ORJSONRenderer().render(paginator.get_paginated_data(page))
+        etag = _make_etag(payload)
+        cache.set(cache_key, (etag, payload), ARTICLES_CACHE_TTL)
+        # Another worker or an expired entry may have produced this ETag.
+        return _json_etag_response(request, etag, payload)
 
     @extend_schema(
         summary="Artikel art_supplier aktualisieren",
@@ -161,60 +309,79 @@ class ArticlesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if art_supplier not in ["OKB", "RKB", "SW"]:
+        if not _is_choice(art_supplier, VALID_SUPPLIERS):
             return Response(
                 {"success": False, "error": "Invalid art_supplier"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        article = Article.objects.filter(art_no=art_no).first()
-        if not article:
+        updated = Article.objects.filter(art_no=art_no).update(
+            art_supplier=art_supplier
+        )
+        if not updated:
             return Response(
                 {"success": False, "error": "Article not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        article.art_supplier = art_supplier
-        article.save()
+        invalidate_articles_cache()
+        article = (
+            Article.objects.filter(art_no=art_no)
+            .values("art_no", "art_supplier", "description")
+            .first()
+        )
         return Response(
             {
                 "success": True,
                 "message": "Article supplier updated",
-                "data": {
-                    "art_no": article.art_no,
-                    "art_supplier": article.art_supplier,
-                    "description": article.description,
-                },
+                "data": article,
             },
             status=status.HTTP_200_OK,
         )
 
 
-def generate_unique_tag_id():
-    alphabet = string.hexdigits.upper()
-    while True:
-        candidate = "".join(secrets.choice(alphabet) for _ in range(24))
-        if not Tags.objects.filter(tag_id=candidate).exists():
-            return candidate
+def _fast_tag_id():
+    """Return a random 24-character hex tag ID.
+
+    Random bytes are sliced from a thread-local buffer that is refilled
+    from os.urandom() in 4 KiB blocks, so most IDs need no syscall. The
+    buffer is discarded after a fork so worker processes never share it.
+    """
+    pid = os.getpid()
+    buf = getattr(_tag_id_entropy, "buf", None)
+    offset = getattr(_tag_id_entropy, "offset", 0)
+    if (
+        buf is None
+        or _tag_id_entropy.pid != pid
+        or offset + TAG_ID_BYTES > len(buf)
+    ):
+        buf = _tag_id_entropy.buf = os.urandom(TAG_ID_ENTROPY_BUFFER_SIZE)
+        _tag_id_entropy.pid = pid
+        offset = 0
+    _tag_id_entropy.offset = offset + TAG_ID_BYTES
+    return buf[offset : offset + TAG_ID_BYTES].hex().upper()
 
 
 def generate_unique_order_no():
-    """Generate an ascending 8-digit order number."""
-    # Get the highest existing order number
-    last_order = Orders.objects.all().order_by("-order_no").first()
+    """Generate an ascending 10-digit order number."""
+    return generate_unique_order_nos(1)[0]
+
 
-    if last_order and last_order.order_no.isdigit():
-        next_number = int(last_order.order_no) + 1
-    else:
-        # Start from 10000000 (8 digits)
-        next_number = 1000000000
+def generate_unique_order_nos(count):
+    """Generate ``count`` ascending 10-digit order numbers.
 
-    # Ensure it's 8 digits and doesn't overflow
-    if next_number > 9999999999:
-        # Wrap around or raise error
-        next_number = 0
+    Numbers are drawn from the ``api_orders_order_no_seq`` database
+    sequence in a single round trip, which is atomic under concurrent
+    requests.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval('api_orders_order_no_seq') FROM generate_series(1, %s)",
+            [count],
+        )
+        numbers = sorted(row[0] for row in cursor.fetchall())
 
-    return str(next_number).zfill(10)
+    return [str(number).zfill(10) for number in numbers]
 
 
 class TagsView(APIView):
@@ -224,6 +391,8 @@ class TagsView(APIView):
     DELETE: delete tag (tag_id in body)
     """
 
+    pagination_class = TagPagination
+
     @extend_schema(
         summary="Liste aller Tags",
         parameters=[
@@ -246,32 +415,35 @@ class TagsView(APIView):
                 type=int,
                 enum=[0, 1],
             ),
+            *PAGINATION_PARAMETERS,
         ],
         responses={
-            200: inline_serializer(
-                name="TagListResponse",
-                fields={
-                    "success": serializers.BooleanField(default=True),
-                    "data": inline_serializer(
-                        name="TagData",
-                        fields={
-                            "tag_id": serializers.CharField(),
-                            "art_no": serializers.CharField(),
-                            "description": serializers.CharField(),
-                            "status": serializers.IntegerField(),
-                            "art_supplier": serializers.CharField(),
-                            "created_at": serializers.DateTimeField(),
-                        },
-                        many=True,
-                    ),
-                },
+            200: _paginated_list_response(
+                "TagListResponse",
+                inline_serializer(
+                    name="TagData",
+                    fields={
+                        "tag_id": serializers.CharField(),
+                        "art_no": serializers.CharField(),
+                        "description": serializers.CharField(),
+                        "status": serializers.IntegerField(),
+                        "art_supplier": serializers.CharField(),
+                        "created_at": serializers.DateTimeField(),
+                    },
+                    many=True,
+                ),
             )
         },
         tags=["Tags"],
     )
     def get(self, request):
-        qs = Tags.objects.select_related("art_no").only(
-            "tag_id", "art_no__art_no", "art_no__description", "status", "created_at"
+        qs = Tags.objects.values(
+            "tag_id",
+            "art_no__art_no",
+            "art_no__description",
+            "art_no__art_supplier",
+            "status",
+            "created_at",
         )
 
         tag_id = request.query_params.get("tag_id")
@@ -289,18 +461,37 @@ class TagsView(APIView):
             except ValueError:
                 pass
 
-        data = [
-            {
-                "tag_id": t.tag_id,
-                "art_no": t.art_no.art_no,
-                "description": t.art_no.description,
-                "status": t.status,
-                "art_supplier": t.art_no.art_supplier,
-                "created_at": t.created_at,
-            }
-            for t in qs
-        ]
-        return Response({"success": True, "data": data}, status=status.HTTP_200_OK)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        data = paginator.get_paginated_data(
+            [
+                {
+                    "tag_id": t["tag_id"],
+                    "art_no": t["art_no__art_no"],
+                    "description": t["art_no__description"],
+                    "status": t["status"],
+                    "art_supplier": t["art_no__art_supplier"],
+                    "created_at": t["created_at"],
+                }
+                for t in page
+            ]
+        )
+
+        # The ETag covers the page actually served, so it costs no more than
+        # reading the page; the media type keeps JSON and HTML variants apart.
+        payload = ORJSONRenderer().render(data)
+        etag = _make_etag(request.accepted_renderer.media_type.encode() + payload)
+        not_modified = _not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        if isinstance(request.accepted_renderer, ORJSONRenderer):
+            response = HttpResponse(payload, content_type="application/json")
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept",))
+        return response
 
     @extend_schema(
         summary="Tag anlegen, aktualisieren, Status setzen, generieren oder suchen",
@@ -354,25 +545,21 @@ class TagsView(APIView):
         action = body.get("action")
         data = body.get("data", {})
 
-        if not action or action not in [
-            "create",
-            "update",
-            "set_status",
-            "generate",
-            "search",
-        ]:
+        if not _is_choice(action, TAG_ACTIONS):
             return Response(
                 {"success": False, "error": "Invalid action"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Generate unique tag_id
+        # Generate tag_id. Random IDs are not checked against the database:
+        # with 96 random bits a collision is negligible, and the primary key
+        # still rejects one with 409 on the create action.
         if action == "generate":
             preferred = data.get("preferred_tag_id")
             if preferred and not Tags.objects.filter(tag_id=preferred).exists():
                 tag_id = preferred
             else:
-                tag_id = generate_unique_tag_id()
+                tag_id = _fast_tag_id()
             return Response(
                 {
                     "success": True,
@@ -392,25 +579,46 @@ class TagsView(APIView):
                     {"success": False, "error": "tag_id and art_no are required"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            if Tags.objects.filter(tag_id=tag_id).exists():
-                return Response(
-                    {"success": False, "error": "Tag already exists"},
-                    status=status.HTTP_409_CONFLICT,
-                )
-            article = Article.objects.filter(art_no=art_no).first()
-            if not article:
+            if not _is_choice(tag_status, VALID_STATUSES):
                 return Response(
-                    {"success": False, "error": "Article not found"},
-                    status=status.HTTP_404_NOT_FOUND,
+                    {"success": False, "error": "status must be 0 or 1"},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-            tag = Tags.objects.create(tag_id=tag_id, art_no=article, status=tag_status)
+            # Resolve the article inside the INSERT; the primary key and NOT NULL
+            # constraints report duplicate tags and unknown articles.
+            try:
+                with transaction.atomic():
+                    tag = Tags.objects.create(
+                        tag_id=tag_id,
+                        art_no_id=Subquery(
+                            Article.objects.filter(art_no=art_no)
+                            .order_by("pk")
+                            .values("id")[:1]
+                        ),
+                        status=tag_status,
+                    )
+            except IntegrityError as e:
+                pgcode = getattr(e.__cause__, "pgcode", None)
+                if pgcode == errorcodes.UNIQUE_VIOLATION:
+                    return Response(
+                        {"success": False, "error": "Tag already exists"},
+                        status=status.HTTP_409_CONFLICT,
+                    )
+                diag = getattr(e.__cause__, "diag", None)
+                column = getattr(diag, "column_name", None)
+                if pgcode == errorcodes.NOT_NULL_VIOLATION and column == "art_no_id":
+                    return Response(
+                        {"success": False, "error": "Article not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+                raise
             return Response(
                 {
                     "success": True,
                     "message": "Tag created",
                     "data": {
                         "tag_id": tag.tag_id,
-                        "art_no": article.art_no,
+                        "art_no": art_no,
                         "status": tag.status,
                     },
                 },
@@ -423,22 +631,28 @@ class TagsView(APIView):
                     {"success": False, "error": "tag_id is required"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            tag = Tags.objects.filter(tag_id=tag_id).first()
+            tag = Tags.objects.select_related("art_no").filter(tag_id=tag_id).first()
             if not tag:
                 return Response(
                     {"success": False, "error": "Tag not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
             if art_no:
-                article = Article.objects.filter(art_no=art_no).first()
-                if not article:
+                article_id = (
+                    Article.objects.filter(art_no=art_no)
+                    .values_list("id", flat=True)
+                    .first()
+                )
+                if article_id is None:
                     return Response(
                         {"success": False, "error": "Article not found"},
                         status=status.HTTP_404_NOT_FOUND,
                     )
-                tag.art_no = article
+                tag.art_no_id = article_id
+            else:
+                art_no = tag.art_no.art_no
             if "status" in data:
-                if tag_status not in [0, 1]:
+                if not _is_choice(tag_status, VALID_STATUSES):
                     return Response(
                         {"success": False, "error": "status must be 0 or 1"},
                         status=status.HTTP_400_BAD_REQUEST,
@@ -451,7 +665,7 @@ class TagsView(APIView):
                     "message": "Tag updated",
                     "data": {
                         "tag_id": tag.tag_id,
-                        "art_no": tag.art_no.art_no,
+                        "art_no": art_no,
                         "status": tag.status,
                     },
                 },
@@ -469,7 +683,7 @@ class TagsView(APIView):
                     {"success": False, "error": "status is required"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            if tag_status not in [0, 1]:
+            if not _is_choice(tag_status, VALID_STATUSES):
                 return Response(
                     {"success": False, "error": "status must be 0 or 1"},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -487,9 +701,19 @@ class TagsView(APIView):
             updated_tags = []
             not_found_tags = []
 
-            # Fetch all tags at once
-            tags = Tags.objects.filter(tag_id__in=tag_ids)
-            tags_dict = {tag.tag_id: tag for tag in tags}
+            with transaction.atomic():
+                # Fetch and lock all tags with their article number at once
+                tags = (
+                    Tags.objects.select_for_update(of=("self",))
+                    .filter(tag_id__in=tag_ids)
+                    .values("tag_id", "art_no__art_no")
+                )
+                tags_dict = {tag["tag_id"]: tag for tag in tags}
+
+                # Update all found tags in a single statement
+                Tags.objects.filter(tag_id__in=tags_dict).update(
+                    status=tag_status, updated_at=timezone.now()
+                )
 
             for tid in tag_ids:
                 tag = tags_dict.get(tid)
@@ -497,13 +721,11 @@ class TagsView(APIView):
                     not_found_tags.append(tid)
                     continue
 
-                tag.status = tag_status
-                tag.save()
                 updated_tags.append(
                     {
-                        "tag_id": tag.tag_id,
-                        "art_no": tag.art_no.art_no,
-                        "status": tag.status,
+                        "tag_id": tag["tag_id"],
+                        "art_no": tag["art_no__art_no"],
+                        "status": tag_status,
                     }
                 )
 
@@ -543,7 +765,17 @@ class TagsView(APIView):
                     {"success": False, "error": "tag_id is required"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            tag = Tags.objects.filter(tag_id=tag_id).first()
+            tag = (
+                Tags.objects.filter(tag_id=tag_id)
+                .values(
+                    "tag_id",
+                    "art_no__art_no",
+                    "art_no__description",
+                    "status",
+                    "art_no__art_supplier",
+                )
+                .first()
+            )
             if not tag:
                 return Response(
                     {"success": False, "error": "Tag not found"},
@@ -554,11 +786,11 @@ class TagsView(APIView):
                     "success": True,
                     "message": "Searched tag",
                     "data": {
-                        "tag_id": tag.tag_id,
-                        "art_no": tag.art_no.art_no,
-                        "description": tag.art_no.description,
-                        "status": tag.status,
-                        "art_supplier": tag.art_no.art_supplier,
+                        "tag_id": tag["tag_id"],
+                        "art_no": tag["art_no__art_no"],
+                        "description": tag["art_no__description"],
+                        "status": tag["status"],
+                        "art_supplier": tag["art_no__art_supplier"],
                     },
                 },
                 status=status.HTTP_200_OK,
@@ -618,19 +850,15 @@ class TagsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Find all matching tags
-        tags = Tags.objects.filter(tag_id__in=tag_id_list)
+        # Delete all matching tags
+        deleted_count, _ = Tags.objects.filter(tag_id__in=tag_id_list).delete()
 
-        if not tags.exists():
+        if not deleted_count:
             return Response(
                 {"success": False, "error": "No tags found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Delete all found tags
-        deleted_count = tags.count()
-        tags.delete()
-
         return Response(
             {"success": True, "message": f"{deleted_count} tag(s) deleted"},
             status=status.HTTP_200_OK,
@@ -643,24 +871,24 @@ class OrderView(APIView):
     POST: create or update order (action in body)
     """
 
+    pagination_class = OrderPagination
+
     @extend_schema(
         summary="Liste aller Bestellungen",
+        parameters=PAGINATION_PARAMETERS,
         responses={
-            200: inline_serializer(
-                name="OrderListResponse",
-                fields={
-                    "success": serializers.BooleanField(default=True),
-                    "data": inline_serializer(
-                        name="OrderData",
-                        fields={
-                            "order_no": serializers.CharField(),
-                            "art_no": serializers.CharField(),
-                            "status": serializers.IntegerField(),
-                            "timestamp": serializers.DateTimeField(),
-                        },
-                        many=True,
-                    ),
-                },
+            200: _paginated_list_response(
+                "OrderListResponse",
+                inline_serializer(
+                    name="OrderData",
+                    fields={
+                        "order_no": serializers.CharField(),
+                        "art_no": serializers.CharField(),
+                        "status": serializers.IntegerField(),
+                        "timestamp": serializers.DateTimeField(),
+                    },
+                    many=True,
+                ),
             )
         },
         tags=["Orders"],
@@ -675,6 +903,8 @@ class OrderView(APIView):
             except ValueError:
                 pass
 
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(qs, request, view=self)
         data = [
             {
                 "order_no": o.order_no,
@@ -682,9 +912,9 @@ class OrderView(APIView):
                 "status": o.status,
                 "timestamp": o.timestamp,
             }
-            for o in qs
+            for o in page
         ]
-        return Response({"success": True, "data": data}, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(data)
 
     @extend_schema(
         summary="Bestellung anlegen oder aktualisieren",
@@ -744,7 +974,7 @@ class OrderView(APIView):
         action = body.get("action")
         data = body.get("data", {})
 
-        if action not in ["create", "update"]:
+        if not _is_choice(action, ORDER_ACTIONS):
             return Response(
                 {"success": False, "error": "Invalid action"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -771,30 +1001,30 @@ class OrderView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Erstelle Orders für alle art_no
-            from django.utils import timezone
-            from datetime import timedelta
-
-            created_orders = []
-            base_time = timezone.now()
-
-            for idx, article_number in enumerate(art_no):
-                # Füge Mikrosekunden hinzu für unterschiedliche Timestamps
-                order_time = base_time + timedelta(microseconds=idx * 1000)
-
-                order = Orders(
-                    art_no=article_number, status=order_status, timestamp=order_time
+            # Erstelle Orders für alle art_no; die Datenbank vergibt mit
+            # clock_timestamp() unterschiedliche Timestamps pro Zeile
+            with transaction.atomic():
+                order_nos = generate_unique_order_nos(len(art_no))
+                orders = Orders.objects.bulk_create(
+                    [
+                        Orders(
+                            order_no=order_no,
+                            art_no=article_number,
+                            status=order_status,
+                        )
+                        for order_no, article_number in zip(order_nos, art_no)
+                    ]
                 )
-                order.save()
 
-                created_orders.append(
-                    {
-                        "order_no": order.order_no,
-                        "art_no": order.art_no,
-                        "status": order.status,
-                        "timestamp": order.timestamp,
-                    }
-                )
+            created_orders = [
+                {
+                    "order_no": order.order_no,
+                    "art_no": order.art_no,
+                    "status": order.status,
+                    "timestamp": order.timestamp,
+                }
+                for order in orders
+            ]
 
             message = f"{len(created_orders)} order(s) created"
             return Response(
@@ -836,7 +1066,7 @@ class OrderView(APIView):
                     order.art_no = art_no
 
             if "status" in data:
-                if order_status not in [0, 1]:
+                if not _is_choice(order_status, VALID_STATUSES):
                     return Response(
                         {"success": False, "error": "status must be 0 or 1"},
                         status=status.HTTP_400_BAD_REQUEST,
@@ -27,6 +27,9 @@ SECRET_KEY = "django-insecure-w8qyn-ao8+l!cn7(=+5pgfo4!)88$q%z1b*q3cb8mtl(rejmf)
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True if os.environ.get("DJANGO_DEBUG") == "True" else False
 
+# Serve the health and metrics endpoints with async views (uvicorn/daphne)
+ASGI_MODE = True if os.environ.get("DJANGO_ASGI_MODE") == "True" else False
+
 ALLOWED_HOSTS = os.environ.get("ALLOWED_HOST").replace(" ", "").split(",") + [
     os.environ.get("POD_IP", "")
 ]
@@ -49,6 +52,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # 3rd Party
     "rest_framework",
     "drf_spectacular",
@@ -96,10 +100,26 @@ DATABASES = {
         "USER": os.environ.get("POSTGRES_DB_USER"),
         "PASSWORD": os.environ.get("POSTGRES_DB_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_DB_HOST"),
+        # Keep connections open between requests instead of reconnecting
+        # every time; health checks discard connections that went stale.
+        "CONN_MAX_AGE": int(os.environ.get("POSTGRES_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -155,6 +175,10 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
 SPECTACULAR_SETTINGS = {
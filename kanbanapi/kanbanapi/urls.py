@@ -15,16 +15,27 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
-from kanbanapi.views import health_check, readiness_check, metrics
+from kanbanapi import views
+
+# Under ASGI the probes use async views so they do not occupy a sync thread
+if settings.ASGI_MODE:
+    health_view = views.health_check_async
+    ready_view = views.readiness_check_async
+    metrics_view = views.metrics_async
+else:
+    health_view = views.health_check
+    ready_view = views.readiness_check
+    metrics_view = views.metrics
 
 # Health check and metrics endpoints (not localized)
 urlpatterns = [
-    path("health/", health_check, name="health"),
-    path("ready/", readiness_check, name="ready"),
-    path("metrics/", metrics, name="metrics"),
+    path("health/", health_view, name="health"),
+    path("ready/", ready_view, name="ready"),
+    path("metrics/", metrics_view, name="metrics"),
 ]
 
 urlpatterns += [
@@ -1,35 +1,198 @@
 """Health check views for Kubernetes probes."""
 
 # django ressources
-from django.http import JsonResponse, HttpResponse
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 from django.db import connection
-from django.db.utils import OperationalError
+from django.db.utils import InterfaceError, OperationalError
 
 # Python default libraries
+import hashlib
+import threading
 import time
 
+# Readiness and metrics share this database status for DB_STATUS_TTL seconds
+DB_STATUS_TTL = 5.0
+_db_status = {"ts": float("-inf"), "ok": False}
+_db_status_lock = threading.Lock()
+
+# Probe bodies never change, so they are serialized once
+_HEALTHY_BODY = b'{"status": "healthy"}'
+_READY_BODY = b'{"status": "ready", "database": "connected"}'
+_NOT_READY_BODY = b'{"status": "not ready", "database": "disconnected"}'
+# Readiness outcome per database status: (status code, WSGI status, body)
+_READINESS_OUTCOMES = {
+    True: (200, "200 OK", _READY_BODY),
+    False: (503, "503 Service Unavailable", _NOT_READY_BODY),
+}
+_HEALTHY_ETAG = quote_etag(
+    hashlib.md5(_HEALTHY_BODY, usedforsecurity=False).hexdigest()
+)
+
+# Metrics output; only the database flag and the duration vary per scrape
+_METRICS_TEMPLATE = (
+    b"# HELP kanbanapi_up Application is running\n"
+    b"# TYPE kanbanapi_up gauge\n"
+    b"kanbanapi_up 1\n"
+    b"\n"
+    b"# HELP kanbanapi_database_available Database connection status "
+    b"(1=connected, 0=disconnected)\n"
+    b"# TYPE kanbanapi_database_available gauge\n"
+    b"kanbanapi_database_available %d\n"
+    b"\n"
+    b"# HELP kanbanapi_metrics_generation_duration_seconds Time to generate metrics\n"
+    b"# TYPE kanbanapi_metrics_generation_duration_seconds gauge\n"
+    b"kanbanapi_metrics_generation_duration_seconds %.6f\n"
+)
+# A rendered body has this size unless generating it took ten seconds or more
+_METRICS_SAMPLE_BODY = _METRICS_TEMPLATE % (0, 0.0)
+
+
+def _head_response(body, status, content_type="application/json"):
+    """Answer a HEAD request with the headers of the matching GET response."""
+    response = HttpResponse(status=status, content_type=content_type)
+    response["Content-Length"] = str(len(body))
+    return response
+
+
+def _health_response(request):
+    """Build the liveness response; shared by the sync and async views."""
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" in etags or _HEALTHY_ETAG in etags:
+        response = HttpResponseNotModified()
+    elif request.method == "HEAD":
+        response = _head_response(_HEALTHY_BODY, 200)
+    else:
+        response = HttpResponse(
+            _HEALTHY_BODY, status=200, content_type="application/json"
+        )
+    # Liveness never changes while the process runs, so intermediaries may
+    # answer repeated probes themselves for a second.
+    response["ETag"] = _HEALTHY_ETAG
+    response["Cache-Control"] = "public, max-age=1"
+    return response
+
 
 def health_check(request):
     """
     Basic health check endpoint for liveness probe.
     Returns 200 if the application is running.
     """
-    return JsonResponse({"status": "healthy"}, status=200)
+    return _health_response(request)
+
+
+async def health_check_async(request):
+    """ASGI variant of health_check; does no blocking work at all."""
+    return _health_response(request)
+
+
+def _db_available_cached():
+    """
+    Return whether the database is reachable, probing at most once every
+    DB_STATUS_TTL seconds per process. A persistent connection that is
+    already open is checked with a query; an open connection alone says
+    nothing about whether the server is still there.
+    """
+    now = time.monotonic()
+    with _db_status_lock:
+        if now - _db_status["ts"] < DB_STATUS_TTL:
+            return _db_status["ok"]
+        if connection.connection is not None:
+            ok = connection.is_usable()
+            if not ok:
+                # Drop the dead connection so the next request reconnects.
+                connection.close()
+        else:
+            try:
+                connection.ensure_connection()
+                ok = True
+            except (OperationalError, InterfaceError):
+                ok = False
+        _db_status["ok"] = ok
+        _db_status["ts"] = now
+        return ok
+
+
+async def _db_available_cached_async():
+    """
+    Async counterpart of _db_available_cached(). A fresh cached status is
+    returned on the event loop; only a stale one hands the probe to a thread.
+    """
+    if time.monotonic() - _db_status["ts"] < DB_STATUS_TTL:
+        return _db_status["ok"]
+    return await sync_to_async(_db_available_cached, thread_sensitive=True)()
+
+
+def fast_probe_response(environ):
+    """
+    Answer GET/HEAD on /health/ and /ready/ directly from the WSGI environ
+    when no Django work is needed. Returns (status, headers, body), or None
+    to let the request go through Django as usual. Readiness is only
+    answered here while the cached database status is fresh.
+    """
+    method = environ.get("REQUEST_METHOD")
+    if method not in ("GET", "HEAD"):
+        return None
+    path = environ.get("PATH_INFO")
+    # Paths as routed in kanbanapi/urls.py
+    if path == "/health/":
+        headers = [("ETag", _HEALTHY_ETAG), ("Cache-Control", "public, max-age=1")]
+        etags = parse_etags(environ.get("HTTP_IF_NONE_MATCH", ""))
+        if "*" in etags or _HEALTHY_ETAG in etags:
+            return "304 Not Modified", headers, b""
+        status, body = "200 OK", _HEALTHY_BODY
+    elif path == "/ready/":
+        if time.monotonic() - _db_status["ts"] >= DB_STATUS_TTL:
+            return None
+        headers = []
+        _, status, body = _READINESS_OUTCOMES[_db_status["ok"]]
+    else:
+        return None
+    headers.append(("Content-Type", "application/json"))
+    headers.append(("Content-Length", str(len(body))))
+    return status, headers, b"" if method == "HEAD" else body
+
+
+def _readiness_response(request, db_ok):
+    """Build the readiness response for the given database status."""
+    status, _, body = _READINESS_OUTCOMES[db_ok]
+    if request.method == "HEAD":
+        return _head_response(body, status)
+    return HttpResponse(body, status=status, content_type="application/json")
 
 
 def readiness_check(request):
     """
     Readiness check endpoint that verifies database connectivity.
     Returns 200 if the application is ready to serve requests.
+    The database status comes from _db_available_cached().
     """
-    try:
-        # Check database connection
-        connection.ensure_connection()
-        return JsonResponse({"status": "ready", "database": "connected"}, status=200)
-    except OperationalError:
-        return JsonResponse(
-            {"status": "not ready", "database": "disconnected"}, status=503
+    return _readiness_response(request, _db_available_cached())
+
+
+async def readiness_check_async(request):
+    """ASGI variant of readiness_check."""
+    return _readiness_response(request, await _db_available_cached_async())
+
+
+def _metrics_early_response(request):
+    """Return the bodiless response for HEAD or unsupported Accept, else None."""
+    # HEAD and clients that cannot read the text format get no body
+    if request.method == "HEAD":
+        return _head_response(
+            _METRICS_SAMPLE_BODY, 200, content_type="text/plain; version=0.0.4"
         )
+    if not request.accepts("text/plain"):
+        return HttpResponse(status=406)
+    return None
+
+
+def _metrics_response(db_ok, start_ns):
+    """Render the metrics body for the given database status."""
+    generation_time = (time.perf_counter_ns() - start_ns) * 1e-9
+    body = _METRICS_TEMPLATE % (1 if db_ok else 0, generation_time)
+    return HttpResponse(body, content_type="text/plain; version=0.0.4")
 
 
 def metrics(request):
@@ -37,38 +200,20 @@ def metrics(request):
     Prometheus-compatible metrics endpoint for application monitoring.
     Returns metrics in Prometheus text format for scraping.
     Focuses on application health without database-specific metrics.
+    kanbanapi_database_available is the result of the last real database
+    probe, at most DB_STATUS_TTL seconds old.
     """
-    metrics_lines = []
-    start_time = time.time()
-
-    # Application up metric
-    metrics_lines.append("# HELP kanbanapi_up Application is running")
-    metrics_lines.append("# TYPE kanbanapi_up gauge")
-    metrics_lines.append("kanbanapi_up 1")
-    metrics_lines.append("")
-
-    # Database connectivity check (just connection status, not data)
-    metrics_lines.append(
-        "# HELP kanbanapi_database_available Database connection status (1=connected, 0=disconnected)"
-    )
-    metrics_lines.append("# TYPE kanbanapi_database_available gauge")
-    try:
-        connection.ensure_connection()
-        metrics_lines.append("kanbanapi_database_available 1")
-    except Exception:
-        metrics_lines.append("kanbanapi_database_available 0")
-    metrics_lines.append("")
-
-    # Metrics generation duration
-    generation_time = time.time() - start_time
-    metrics_lines.append(
-        "# HELP kanbanapi_metrics_generation_duration_seconds Time to generate metrics"
-    )
-    metrics_lines.append("# TYPE kanbanapi_metrics_generation_duration_seconds gauge")
-    metrics_lines.append(
-        f"kanbanapi_metrics_generation_duration_seconds {generation_time:.6f}"
-    )
-
-    return HttpResponse(
-        "\n".join(metrics_lines), content_type="text/plain; version=0.0.4"
-    )
+    early = _metrics_early_response(request)
+    if early is not None:
+        return early
+    start_ns = time.perf_counter_ns()
+    return _metrics_response(_db_available_cached(), start_ns)
+
+
+async def metrics_async(request):
+    """ASGI variant of metrics."""
+    early = _metrics_early_response(request)
+    if early is not None:
+        return early
+    start_ns = time.perf_counter_ns()
+    return _metrics_response(await _db_available_cached_async(), start_ns)
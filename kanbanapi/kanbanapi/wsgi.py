@@ -13,4 +13,16 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "kanbanapi.settings")
 
-application = get_wsgi_application()
+django_application = get_wsgi_application()
+
+from kanbanapi.views import fast_probe_response  # noqa: E402
+
+
+def application(environ, start_response):
+    """Serve Kubernetes probes without Django dispatch where possible."""
+    probe = fast_probe_response(environ)
+    if probe is None:
+        return django_application(environ, start_response)
+    status, headers, body = probe
+    start_response(status, headers)
+    return [body]